@@ -6,9 +6,15 @@ To Record Which file is from Which Folder
 
 import os
 import csv
+import html
+import time
+import asyncio
+from array import array
+from bisect import bisect_right
 from datetime import datetime
 from collections import Counter
-from multiprocessing import Pool
+from itertools import count
+from concurrent.futures import ThreadPoolExecutor
 
 class FileStatsCollector:
     """
@@ -19,11 +25,18 @@ class FileStatsCollector:
         media_extensions (list): List of allowed media file extensions.
         all_files (bool): Flag indicating whether to gather statistics for all files or only media files.
         skip_folders (list): List of folders to skip while gathering statistics.
+        verbose (bool): Flag indicating whether to print the progress of the scan folder by folder.
+        names, types, folders (list): File name, file type and source folder of every gathered file.
+        sizes (array): File sizes in bytes, aligned with the other columns.
+        ctimes, mtimes (array): Raw creation and modification timestamps, formatted only when exported.
+        file_stats (list): The same statistics as one dictionary per file, built from the columns on access.
 
     Methods:
         is_media_file(filename): Check if a given filename has a valid media file extension.
+        get_file_type(filename): Get the lowercased extension of a filename.
         check_root_folder(folder): Check if the specified root folder exists; raise an error if it doesn't.
         format_size(size): Format file size in a human-readable format.
+        format_timestamp(timestamp): Format a file timestamp as 'YYYY-MM-DD HH:MM:SS'.
         gather_file_stats(): Scan the root folder for media files, collect file statistics, and return the obtained statistics.
         generate_file_stats_csv(): Generate a CSV file containing detailed statistics of media files.
         show_file_size_distribution(): Display the distribution of file sizes.
@@ -46,13 +59,84 @@ class FileStatsCollector:
         file_stats_collector.show_file_size_distribution()
         file_stats_collector.print_summary_stats()
     """
-    def __init__(self, root_folder, media_extensions=['.mp3', '.mp4', '.avi', '.mkv', '.jpg', '.jpeg', '.png', '.gif'], all_files=False, skip_folders=[]):
+    # Media file extensions gathered when none are given; a tuple so no instance can change the shared default
+    DEFAULT_MEDIA_EXTENSIONS = ('.mp3', '.mp4', '.avi', '.mkv', '.jpg', '.jpeg', '.png', '.gif')
+
+    # File size ranges for show_file_size_distribution: labels and the ascending, exclusive upper bound of
+    # each range but the last, which is open-ended
+    SIZE_RANGE_LABELS = ('0-1KB', '1KB-100KB', '100KB-1MB', '1MB-10MB', '10MB-100MB', '100MB+', '500MB+')
+    SIZE_RANGE_BOUNDS = (1024, 1024 * 100, 1024 * 1024, 1024 * 1024 * 10, 1024 * 1024 * 100, 1024 * 1024 * 500)
+
+    def __init__(self, root_folder, media_extensions=None, all_files=False, skip_folders=None, verbose=False):
+        if media_extensions is None:
+            media_extensions = self.DEFAULT_MEDIA_EXTENSIONS
+        if skip_folders is None:
+            skip_folders = []
         self.root_folder = self.check_root_folder(root_folder)
+        self.verbose = verbose
         self.media_extensions = media_extensions
+        media_ext = [ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in media_extensions]
+        self._media_ext_set = frozenset(media_ext)
+        # Extensions with more than one dot, e.g. '.tar.gz' or 'd.ts', are not the last suffix of a name, so they are
+        # matched with endswith on the extension as given, the way every extension used to be matched
+        self._media_ext_suffixes = tuple(ext.lower() for ext, dotted in zip(media_extensions, media_ext) if dotted.count('.') > 1)
         self.all_files = all_files
         self.skip_folders = skip_folders
-        self.file_stats = self._gather_file_stats()
-        self.file_types = [stat["File Type"] for stat in self.file_stats]
+        # Bare names prune any folder with that name, absolute paths and paths starting with '.' or '..' prune
+        # that exact folder, and other relative paths such as 'venv/Lib' prune every folder whose path ends with them.
+        # An entry is classified as written, before normpath could turn e.g. './media' into the bare name 'media'.
+        skip, skip_paths, skip_suffixes = set(), set(), []
+        for folder in skip_folders:
+            parts = (folder.replace(os.altsep, os.sep) if os.altsep else folder).split(os.sep)
+            if len(parts) == 1:
+                skip.add(os.path.normcase(folder))
+            elif os.path.isabs(folder) or parts[0] in (os.curdir, os.pardir):
+                skip_paths.add(os.path.normcase(os.path.abspath(folder)))
+            else:
+                skip_suffixes.append(os.sep + os.path.normcase(os.path.normpath(folder)))
+        self._skip = frozenset(skip)
+        self._skip_paths = frozenset(skip_paths)
+        self._skip_suffixes = tuple(skip_suffixes)
+        # File statistics are stored column-wise, one entry per file in every column
+        self.names = []
+        self.types = []
+        self.sizes = array('q')
+        self.ctimes = array('d')
+        self.mtimes = array('d')
+        self.folders = []
+        # Distributions are filled in while the folders are appended, so they need no second pass
+        self._type_counter = Counter()
+        self._folder_counter = Counter()
+        self._folder_sizes = {}
+        self._gather_file_stats()
+
+    @property
+    def file_types(self):
+        """
+        list: The file type of every gathered file; the types column itself, not a copy.
+        """
+        return self.types
+
+    @property
+    def file_stats(self):
+        """
+        list: A list of dictionaries containing file statistics, one per file.
+
+        The dictionaries are built from the columns on every access, so loops over many files
+        should read the columns directly instead.
+        """
+        format_size = self.format_size
+        format_timestamp = self.format_timestamp
+        return [{
+            'File Name': name,
+            'File Type': file_type,
+            'File Size (Bytes)': size,
+            'File Size (Human Readable)': format_size(size),
+            'Creation Date': format_timestamp(ctime),
+            'Modification Date': format_timestamp(mtime),
+            'Source Folder': folder
+        } for name, file_type, size, ctime, mtime, folder in zip(
+            self.names, self.types, self.sizes, self.ctimes, self.mtimes, self.folders)]
 
     def get_styles(self):
         styles = f"""
@@ -138,7 +222,22 @@ h2 {{
         Returns:
             bool: True if the file has a valid media extension, False otherwise.
         """
-        return any(filename.lower().endswith(ext) for ext in self.media_extensions)
+        if self.get_file_type(filename) in self._media_ext_set:
+            return True
+        return bool(self._media_ext_suffixes) and filename.lower().endswith(self._media_ext_suffixes)
+
+    @staticmethod
+    def get_file_type(filename):
+        """
+        Get the lowercased extension of a filename, as stored in the 'File Type' statistic.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            str: The extension including the leading dot, or an empty string if there is none.
+        """
+        return os.path.splitext(filename)[1].lower()
     
     def check_root_folder(self, folder):
         """
@@ -191,70 +290,212 @@ h2 {{
         Returns:
             str: The formatted file size with appropriate units (B, KB, MB, GB, TB).
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                break
-            size /= 1024.0
-        return "{:.2f} {}".format(size, unit)
+        units = ('B', 'KB', 'MB', 'GB', 'TB')
+        # Each unit is 1024 (2**10) times the previous one, so the unit follows from the bit length of the whole bytes
+        exponent = min(max(int(size).bit_length() - 1, 0) // 10, len(units) - 1)
+        return "{:.2f} {}".format(size / (1 << (10 * exponent)), units[exponent])
 
-    def process_files(self, foldername, all_files, is_media_file, format_size):
+    @staticmethod
+    def format_timestamp(timestamp):
+        """
+        Format a file timestamp as 'YYYY-MM-DD HH:MM:SS'.
+
+        Args:
+            timestamp (float): Seconds since the epoch, as returned in an os.stat_result.
+
+        Returns:
+            str: The formatted date and time.
+        """
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+    def process_files(self, foldername, entries):
         """
         Process files within a folder and collect file statistics.
 
         Args:
             foldername (str): Path of the folder to process.
-            all_files (bool): Flag indicating whether to collect statistics for all files or only media files.
-            is_media_file (function): Function to check if a file is a media file.
-            format_size (function): Function to format file size.
+            entries (list): os.DirEntry objects for the files directly inside the folder, as found by _scan_folder.
 
         Returns:
-            list: A list of dictionaries containing file statistics.
+            tuple: A list of (File Name, File Type, File Size (Bytes), creation timestamp, modification timestamp)
+                tuples and the total size of those files in bytes.
         """
         folder_stats = []
-        counter = 0
+        folder_size = 0
+        all_files = self.all_files
+        media_ext_set = self._media_ext_set
+        media_ext_suffixes = self._media_ext_suffixes
         try:
-            with os.scandir(foldername) as entries:
-                print("Gathering data from:", foldername)
-                for entry in entries:
-                    if entry.is_file():
-                        filename = entry.name
-                        source_path = os.path.join(foldername, filename)
-                        if all_files or is_media_file(filename):
-                            counter += 1
-                            folder_stats.append({
-                                'File Name': filename,
-                                'File Type': os.path.splitext(filename)[1].lower(),
-                                'File Size (Bytes)': entry.stat().st_size,
-                                'File Size (Human Readable)': format_size(entry.stat().st_size),
-                                'Creation Date': datetime.fromtimestamp(entry.stat().st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                                'Modification Date': datetime.fromtimestamp(entry.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                                'Source Folder': foldername
-                            })
-                            
-                if counter:
-                    print(f"\t>Total Files From {foldername}: {counter}")
+            for entry in entries:
+                filename = entry.name
+                # The extension is worked out once and serves both the media check and the 'File Type' field
+                file_type = os.path.splitext(filename)[1].lower()
+                if (all_files or file_type in media_ext_set
+                        or (media_ext_suffixes and filename.lower().endswith(media_ext_suffixes))):
+                    st = entry.stat()
+                    size = st.st_size
+                    folder_size += size
+                    folder_stats.append((
+                        filename,
+                        file_type,
+                        size,
+                        st.st_ctime,
+                        st.st_mtime
+                    ))
         except Exception as e:
             print(f"Error gathering file stats in folder '{foldername}': {e}")
-        return folder_stats
+        return folder_stats, folder_size
 
-    def _gather_file_stats(self):
+    def _scan_folder(self, path):
         """
-        Scan the root folder for media files, collect file statistics, and return the obtained statistics.
+        Scan a single folder with os.scandir and split its entries into files and sub-folders.
+
+        Files and sub-folders are told apart from the directory entries themselves, so no
+        extra stat is needed to classify them. Skipped folders are left out of the sub-folders.
+
+        Args:
+            path (str): Path of the folder to scan.
 
         Returns:
-            list: A list of dictionaries containing file statistics.
+            tuple: A list of os.DirEntry objects for the files and a list of sub-folder paths to walk.
         """
-        all_files = self.all_files
-        file_stats = []
+        files = []
+        subfolders = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Symlinked files are kept as before; symlinked folders are not followed, like os.walk
+                    if entry.is_file():
+                        files.append(entry)
+                    elif entry.is_dir(follow_symlinks=False) and not self._is_skipped(entry):
+                        subfolders.append(entry.path)
+        except OSError as e:
+            print(f"Error scanning folder '{path}': {e}")
+        return files, subfolders
+
+    def _is_skipped(self, entry):
+        """
+        Check if a folder entry matches one of the skip folders, by name, by full path or by the end of its path.
+
+        Args:
+            entry (os.DirEntry): The folder entry to check.
+
+        Returns:
+            bool: True if the folder and everything under it should be skipped, False otherwise.
+        """
+        if os.path.normcase(entry.name) in self._skip:
+            return True
+        if not (self._skip_paths or self._skip_suffixes):
+            return False
+        path = os.path.normcase(os.path.abspath(entry.path))
+        return path in self._skip_paths or path.endswith(self._skip_suffixes)
+
+    async def _walk(self, path, queue, order):
+        """
+        Walk a folder tree, opening every folder exactly once, and queue each folder's files for processing.
+
+        The folders still to open are kept on an explicit stack rather than recursing, so a deeply nested tree
+        cannot hit the recursion limit.
+
+        Args:
+            path (str): Path of the folder to walk.
+            queue (asyncio.Queue): Queue receiving (index, folder path, file entries) items.
+            order (itertools.count): Counter used to number the folders in walk order.
+        """
+        pending = [path]
+        while pending:
+            path = pending.pop()
+            files, subfolders = await asyncio.to_thread(self._scan_folder, path)
+            if files:
+                await queue.put((next(order), path, files))
+            # Pushed in reverse, so the first subfolder is walked next, the same top-down order os.walk uses
+            pending.extend(reversed(subfolders))
+
+    async def _scan_tree(self):
+        """
+        Walk the root folder, process the found folders concurrently and append their statistics to the columns.
+
+        The walk produces folders into a bounded queue while worker coroutines run process_files on them
+        in threads, so scanning the next folder overlaps with stat-ing the files of the previous ones.
+        Finished folders are appended in walk order as soon as every folder before them is done, so only
+        the results that finished out of order are held back.
+        """
+        workers_count = min(32, (os.cpu_count() or 1) * 4)
+        # process_files only waits on stat calls, which release the GIL, so threads are enough
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=workers_count))
+        queue = asyncio.Queue(maxsize=64)
+        finished = {}
+        next_index = 0
+        errors = []
+
+        async def worker():
+            nonlocal next_index
+            while True:
+                index, foldername, entries = await queue.get()
+                try:
+                    finished[index] = (foldername, *await asyncio.to_thread(self.process_files, foldername, entries))
+                    while next_index in finished:
+                        self._append_folder_stats(*finished.pop(next_index))
+                        next_index += 1
+                except Exception as e:
+                    # The worker keeps draining the queue so the walk can finish; the error is raised once it has
+                    errors.append(e)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(workers_count)]
+        try:
+            await self._walk(self.root_folder, queue, count())
+            await queue.join()
+            if errors:
+                raise errors[0]
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _append_folder_stats(self, foldername, folder_stats, folder_size):
+        """
+        Append the statistics of one folder, as returned by process_files, to the columns and distributions.
 
+        Args:
+            foldername (str): Path of the processed folder.
+            folder_stats (list): The file statistics tuples of the folder.
+            folder_size (int): The total size of the folder's files in bytes.
+        """
+        # Progress is printed here, from the event loop thread and in walk order, rather than from the worker threads
+        if self.verbose:
+            print("Gathering data from:", foldername)
+        if not folder_stats:
+            return
+        if self.verbose:
+            print(f"\t>Total Files From {foldername}: {len(folder_stats)}")
+        names, types, sizes, ctimes, mtimes = zip(*folder_stats)
+        self._type_counter.update(types)
+        self._folder_counter[foldername] = len(folder_stats)
+        self._folder_sizes[foldername] = folder_size
+        self.names.extend(names)
+        self.types.extend(types)
+        self.sizes.extend(sizes)
+        self.ctimes.extend(ctimes)
+        self.mtimes.extend(mtimes)
+        self.folders.extend([foldername] * len(folder_stats))
+
+    def _gather_file_stats(self):
+        """
+        Scan the root folder for media files and append the collected file statistics to the columns.
+        """
         try:
-            with Pool() as pool:
-                folder_stats_lists = pool.starmap(self.process_files, [(foldername, all_files, self.is_media_file, self.format_size) for foldername, _, _ in os.walk(self.root_folder) if all(skip_folder not in foldername for skip_folder in self.skip_folders)])
-                file_stats = [file_stat for folder_stats in folder_stats_lists for file_stat in folder_stats]
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self._scan_tree())
+            else:
+                # Already inside an event loop (e.g. Jupyter): run the scan on its own loop in a helper thread
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(asyncio.run, self._scan_tree()).result()
         except Exception as e:
             print(f"Unexpected error occurred: {e}")
-
-        return file_stats
     
     @staticmethod
     def get_file_stats(file_path):
@@ -274,11 +515,11 @@ h2 {{
             file_stat = os.stat(file_path)
             file_stats.append({
                 'File Name': filename,
-                'File Type': os.path.splitext(filename)[1].lower(),
+                'File Type': FileStatsCollector.get_file_type(filename),
                 'File Size (Bytes)': file_stat.st_size,
                 'File Size (Human Readable)': FileStatsCollector.format_size(file_stat.st_size),
-                'Creation Date': datetime.fromtimestamp(file_stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                'Modification Date': datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                'Creation Date': FileStatsCollector.format_timestamp(file_stat.st_ctime),
+                'Modification Date': FileStatsCollector.format_timestamp(file_stat.st_mtime),
                 'Source Folder': foldername
             })
             # print(file_stats)
@@ -308,20 +549,34 @@ h2 {{
             print(f"An error occurred while sorting by key '{key}': {e}")
             return file_stats
 
+    @staticmethod
+    def _sorted_indices(column, reverse=False):
+        """
+        Get the row indices that put a statistics column in sorted order.
+
+        Args:
+            column (sequence): The column to sort by, e.g. self.sizes.
+            reverse (bool, optional): Whether to sort in reverse order. Defaults to False.
+
+        Returns:
+            list: Row indices in sorted order, usable with every other column.
+        """
+        return sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+
     def generate_file_stats_html(self, html_path=None):
         """
         Generate a pretty HTML report of file statistics.
         """
-        if not self.file_stats:
+        if not self.sizes:
             return
 
-        if len(self.file_stats) > 1500:
+        if len(self.sizes) > 1500:
             user_input = input("Warning: Generating HTML report for a large number of files can consume a significant amount of memory. Do you want to continue? (yes/no): ").strip().lower()
             if user_input != 'yes':
                 print("HTML report generation aborted.")
                 return
 
-        html_content = f"""
+        html_header = f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -347,32 +602,39 @@ h2 {{
                     <th>Source Folder</th>
                 </tr>
         """
-        file_stats = self.sort_by_key(self.file_stats, "File Size (Bytes)", reverse=True)
-        for stat in file_stats:
-            html_content += f"""
+        # One bound format method filled positionally from local column references, no per-row attribute lookups
+        row_template = """
                 <tr>
-                    <td>{stat['File Name']}</td>
-                    <td>{stat['File Type']}</td>
-                    <td>{stat['File Size (Bytes)']}</td>
-                    <td>{stat['File Size (Human Readable)']}</td>
-                    <td>{stat['Creation Date']}</td>
-                    <td>{stat['Modification Date']}</td>
-                    <td>{stat['Source Folder']}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
                 </tr>
-            """
-
-        html_content += """
+            """.format
+        names, types, sizes, ctimes, mtimes, folders = self.names, self.types, self.sizes, self.ctimes, self.mtimes, self.folders
+        format_size, format_timestamp = self.format_size, self.format_timestamp
+        escape = html.escape
+        html_rows = (row_template(escape(names[i]), escape(types[i]), sizes[i], format_size(sizes[i]),
+                                  format_timestamp(ctimes[i]), format_timestamp(mtimes[i]), escape(folders[i]))
+                     for i in self._sorted_indices(sizes, reverse=True))
+
+        html_footer = """
             </table>
         </body>
         </html>
         """
 
-        # Writing HTML content to a file
+        # Streaming the HTML rows to the file instead of building the whole report in memory first
         html_file_name = f'{os.path.basename(self.root_folder)}_file_stats_report.html'
         html_file_path = os.path.join(self.root_folder, html_file_name) if html_path is None else html_path
         try:
-            with open(html_file_path, 'w', encoding='utf-8') as html_file:
-                html_file.write(html_content)
+            with open(html_file_path, 'w', encoding='utf-8', buffering=1 << 20) as html_file:
+                html_file.write(html_header)
+                html_file.writelines(html_rows)
+                html_file.write(html_footer)
             print(f"\nHTML report generated: {html_file_path}")
         except Exception as e:
             print(f"Error generating HTML report: {e}")
@@ -381,7 +643,7 @@ h2 {{
         """
         Generate a CSV file containing detailed statistics of media files or all files.
         """
-        if not self.file_stats:
+        if not self.sizes:
             print("NO Data FOUND: Nothing To Create Csv of")
             return -1
 
@@ -396,23 +658,17 @@ h2 {{
         csv_file_path = os.path.join(self.root_folder, csv_file_name) if csv_path is None else csv_path
 
         try:
-            with open(csv_file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(csv_file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 fieldnames = ['File Name', 'File Type', 'File Size (Bytes)', 'File Size (Human Readable)',
                               'Creation Date', 'Modification Date', 'Source Folder']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.writer(csvfile)
 
-                writer.writeheader()
+                writer.writerow(fieldnames)
 
-                for stat in self.file_stats:
-                    writer.writerow({
-                        'File Name': stat['File Name'],
-                        'File Type': stat['File Type'],
-                        'File Size (Bytes)': stat['File Size (Bytes)'],
-                        'File Size (Human Readable)': stat['File Size (Human Readable)'],
-                        'Creation Date': stat['Creation Date'],
-                        'Modification Date': stat['Modification Date'],
-                        'Source Folder': stat['Source Folder']
-                    })
+                # Rows are positional tuples in fieldnames order, written in one writerows call
+                writer.writerows(zip(self.names, self.types, self.sizes, map(self.format_size, self.sizes),
+                                     map(self.format_timestamp, self.ctimes), map(self.format_timestamp, self.mtimes),
+                                     self.folders))
 
             print(f"\nFile Stats CSV file generated: {csv_file_path}")
         except Exception as e:
@@ -422,28 +678,13 @@ h2 {{
         """
         Display the distribution of file sizes.
         """
-        # Define file size ranges
-        size_ranges = {
-            '0-1KB': (0, 1024),
-            '1KB-100KB': (1024, 1024 * 100),
-            '100KB-1MB': (1024 * 100, 1024 * 1024),
-            '1MB-10MB': (1024 * 1024, 1024 * 1024 * 10),
-            '10MB-100MB': (1024 * 1024 * 10, 1024 * 1024 * 100),
-            '100MB+': (1024 * 1024 * 100, 1024 * 1024 * 500),  # 100MB to 500MB
-            '500MB+': (1024 * 1024 * 500, float('inf'))  # 500MB+
-        }
-
-        # Initialize dictionary to store file count in each range
-        size_distribution = {size_range: 0 for size_range in size_ranges}
-
-        for stat in self.file_stats:
-            file_size = stat['File Size (Bytes)']
-
-            # Determine the size range for the current file size
-            for size_range, (min_size, max_size) in size_ranges.items():
-                if min_size <= file_size < max_size:
-                    size_distribution[size_range] += 1
-                    break
+        bounds = self.SIZE_RANGE_BOUNDS
+        counts = [0] * len(self.SIZE_RANGE_LABELS)
+
+        # The number of upper bounds a size reaches is the index of its range
+        for file_size in self.sizes:
+            counts[bisect_right(bounds, file_size)] += 1
+        size_distribution = dict(zip(self.SIZE_RANGE_LABELS, counts))
 
         print("\nFile Size Distribution (No Files Moved):")
         for size_range, count in size_distribution.items():
@@ -454,18 +695,9 @@ h2 {{
         Get the distribution of folder sizes based on the total size of files contained within each folder.
 
         Returns:
-            dict: A dictionary containing the folder paths as keys and their corresponding total size as values in Bytes.
+            dict: A new dictionary containing the folder paths as keys and their corresponding total size as values in Bytes.
         """
-        folder_sizes = {}  # Dictionary to store folder sizes
-
-        for stat in self.file_stats:
-            folder_path = stat['Source Folder']
-            file_size = stat['File Size (Bytes)']
-
-            # Update total size for the folder
-            folder_sizes[folder_path] = folder_sizes.get(folder_path, 0) + file_size
-
-        return folder_sizes
+        return dict(self._folder_sizes)
     
     def show_folder_size_distribution(self):
         folder_size = self.get_folder_size_distribution()
@@ -480,20 +712,18 @@ h2 {{
         Get the distribution of file types in the file statistics.
 
         Returns:
-            Counter: A Counter object containing the count of each file type.
+            Counter: A new Counter object containing the count of each file type.
         """
-        file_types = Counter(self.file_types)
-        return file_types
+        return Counter(self._type_counter)
 
     def get_folders_info(self):
         """
         Get information about the distribution of files across folders.
 
         Returns:
-            Counter: A Counter object containing the count of files in each folder.
+            Counter: A new Counter object containing the count of files in each folder.
         """
-        folder_info = Counter([stat['Source Folder'] for stat in self.file_stats])
-        return folder_info
+        return Counter(self._folder_counter)
 
     
     def print_file_types(self):
@@ -510,7 +740,7 @@ h2 {{
         Args:
             html_path (str, optional): Path to save the HTML report. If not provided, the report will be saved in the root folder.
         """
-        if not len(self.file_stats):
+        if not self.sizes:
             print("NO Data FOUND: Nothing To Create Html of")
             return -1
         total_files, total_folders, total_size, avg_size, most_occurring_file_type = self.get_summary_stats()
@@ -519,21 +749,22 @@ h2 {{
         folder_size = self.get_folder_size_distribution()
 
         # HTML Code For File Statistics Table
-        file_type_table = "<table><tr><th>File Type</th><th>Count</th></tr>"
-        for file_type, counts in file_type_stats:
-            file_type_table += f"<tr><td>{file_type}</td><td>{counts}</td></tr>\n\t"
-        file_type_table += "</table>"
+        file_type_rows = ["<table><tr><th>File Type</th><th>Count</th></tr>"]
+        file_type_rows.extend(f"<tr><td>{html.escape(file_type)}</td><td>{counts}</td></tr>\n\t" for file_type, counts in file_type_stats)
+        file_type_rows.append("</table>")
+        file_type_table = "".join(file_type_rows)
 
         # HTML Code For Folder Table
-        folder_file_counts_table = "<table><tr><th>Folder</th><th>File Count</th><th>Size</th></tr>"
+        folder_rows = ["<table><tr><th>Folder</th><th>File Count</th><th>Size</th></tr>"]
         for folder, files in folder_file_counts:
             if len(folder) > 20:
                 folder_splitted = folder.split("\\")
                 abbreviated_folder = folder_splitted[0] + "\\...." + "\\".join(folder_splitted[-2:])
             else:
                 abbreviated_folder = folder
-            folder_file_counts_table += f"<tr><td>{abbreviated_folder}</td><td>{files}</td><td>{self.format_size(folder_size[folder])}</td></tr>\n\t"
-        folder_file_counts_table += "</table>"
+            folder_rows.append(f"<tr><td>{html.escape(abbreviated_folder)}</td><td>{files}</td><td>{self.format_size(folder_size[folder])}</td></tr>\n\t")
+        folder_rows.append("</table>")
+        folder_file_counts_table = "".join(folder_rows)
 
         # Complete Html code
         html_content = f"""
@@ -552,13 +783,13 @@ h2 {{
             <div class="container">
                 <h1>Summary Statistics {" (Media Files)" if not self.all_files else ""}</h1>
                 <p class="datetime">Generated on: { datetime.now().strftime("%d-%b-%Y %H:%M:%S") }</p>
-                <p class="root_foldername">Stats For Folder: {self.root_folder}</p>
+                <p class="root_foldername">Stats For Folder: {html.escape(self.root_folder)}</p>
                 <table>
                     <tr><th>Total Files</th><td>{total_files}</td></tr>
                     <tr><th>Total Folders (With Files)</th><td>{total_folders}</td></tr>
                     <tr><th>Total Size</th><td>{self.format_size(total_size)}</td></tr>
                     <tr><th>Average Size</th><td>{self.format_size(avg_size)}</td></tr>
-                    <tr><th>Most Occurring File Type</th><td>{most_occurring_file_type}</td></tr>
+                    <tr><th>Most Occurring File Type</th><td>{html.escape(most_occurring_file_type)}</td></tr>
                 </table>
 
                 <h2>File Type Statistics</h2>
@@ -586,18 +817,17 @@ h2 {{
 
     def get_summary_stats(self):
         try:
-            total_files = len(self.file_stats)
+            total_files = len(self.sizes)
             if not total_files:
                 print("No Files To Show Summary of. ^<>^")
                 return 0, 0, 0, 0.0, None
-            total_size = sum(stat['File Size (Bytes)'] for stat in self.file_stats)
+            total_size = sum(self.sizes)
             avg_size = total_size / total_files if total_files > 0 else 0
 
-            file_types = [stat['File Type'] for stat in self.file_stats]
-            most_occurring_file_type = max(set(file_types), key=file_types.count)
+            most_occurring_file_type = self._type_counter.most_common(1)[0][0]
 
             # Count the unique folders
-            self.unique_folders = set(stat['Source Folder'] for stat in self.file_stats)
+            self.unique_folders = set(self._folder_counter)
             total_folders = len(self.unique_folders)
             return total_files, total_folders, total_size, avg_size, most_occurring_file_type
         except Exception as e:
@@ -609,7 +839,7 @@ h2 {{
         Print a summary of file statistics, including total files, total average size, most occurring file type, and total size.
         """
         try:
-            if not len(self.file_stats):
+            if not self.sizes:
                 print("Nothing To Create Html of")
                 return -1
             total_files, total_folders, total_size, avg_size, most_occurred = self.get_summary_stats()
@@ -1,7 +1,9 @@
 import os
+import errno
 import shutil
 import csv
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from Filing.filestatser import FileStatsCollector
 import re
 
@@ -10,23 +12,29 @@ class MediaGatherer(FileStatsCollector):
     A class for gathering media files from a specified root folder, providing options for file renaming
     and specifying destination folders, and generating statistics on the moved files.
 
+    The file statistics inherited from FileStatsCollector are captured from os.scandir entries while the root
+    folder is scanned, including each file's size. MediaGatherer relies on that and never stats a file again
+    while moving it or reporting on the moved files.
+
     Attributes:
         root_folder (str): The root folder from which media files will be gathered.
         media_folder (str): The default folder where media files will be moved.
-        media_extensions (list): List of allowed media file extensions.
+        media_extensions (list or tuple): Sequence of allowed media file extensions.
         moved_files (list): List of paths to the moved media files.
         file_sources (list): List of tuples containing the original filename and its source folder.
         file_stats_dict (list): List of dictionaries containing detailed statistics of moved media files.
+        verbose (bool): Flag indicating whether to print every scanned folder and every moved file.
+        progress_every (int): Print a progress line after this many moved files when not verbose (0 to disable).
 
     Methods:
         is_media_file(filename): Check if a given filename has a valid media file extension.
         create_media_folder(destination_folder): Create the specified destination folder if it doesn't exist.
-        move_files_to_destination(destination_folder, move_all_files=False): Move media files to the specified destination folder.
+        move_files_to_destination(destination_folder, move_all_files=False, max_workers=5): Move media files to the specified destination folder.
         show_stats(): Display statistics on the moved media files.
         format_size(size): Format file size in a human-readable format.
         show_file_size_distribution(): Display the distribution of file sizes.
         generate_stats_csv(): Generate a CSV file containing detailed statistics of moved media files.
-        gather_media(destination_folder=None, move_all=False): Perform the media gathering process with options for destination folder and moving all files.
+        gather_media(destination_folder=None, move_all=False, max_workers=5): Perform the media gathering process with options for destination folder and moving all files.
 
     Example Usage:
         root_directory = input("Enter the root directory: ")
@@ -37,18 +45,27 @@ class MediaGatherer(FileStatsCollector):
         media_gatherer.gather_media(destination_folder, move_all_files)
         media_gatherer.generate_stats_csv()
     """
-
-    def __init__(self, root_folder, destination_folder=None, skip_folders=None, media_extensions=['.mp3', '.mp4', '.avi', '.mkv', '.jpg', '.jpeg', '.png', '.gif'], all_files=False):
-        if skip_folders is None:
-            skip_folders = []
+    # Matches a basename ending in a "(number)" suffix, capturing the part before it
+    _SUFFIX_RE = re.compile(r'^(.*)\(\d+\)\Z')
+
+    def __init__(self, root_folder, destination_folder=None, skip_folders=None, media_extensions=None, all_files=False, verbose=False, progress_every=50):
+        # Copied, so appending the destination folder never changes the caller's list
+        skip_folders = [] if skip_folders is None else list(skip_folders)
+        if media_extensions is None:
+            media_extensions = self.DEFAULT_MEDIA_EXTENSIONS
         if destination_folder is None:
             destination_folder = os.path.join(root_folder, 'media')
-        skip_folders.append(destination_folder)
-        print(skip_folders)
+        # Absolute, so a relative destination such as './media' prunes only itself, not every folder named 'media'
+        skip_folders.append(os.path.abspath(destination_folder))
+        if verbose:
+            print(skip_folders)
         self.root_folder = root_folder
         self.media_extensions = media_extensions
-        super().__init__(root_folder, media_extensions=media_extensions, skip_folders=skip_folders, all_files=all_files)
+        self.progress_every = progress_every
+        super().__init__(root_folder, media_extensions=media_extensions, skip_folders=skip_folders, all_files=all_files, verbose=verbose)
         self.moved_files = {}
+        self._moved_total_bytes = 0
+        self._dest_names = set()
         self.file_sources = []
         self.file_stats_dict = []
         self.dest_folder = destination_folder
@@ -65,65 +82,158 @@ class MediaGatherer(FileStatsCollector):
             os.makedirs(destination_folder)
             self.dest_folder = destination_folder
 
-    def move_files_to_destination(self, destination_folder, move_all_files=False):
+    def move_files_to_destination(self, destination_folder, move_all_files=False, max_workers=5):
         """
         Move media files to the specified destination folder.
 
+        The moves run concurrently on a thread pool, as they mostly wait on the file system. Destination
+        names are still resolved one file at a time, in order, before each move is submitted, and the moves
+        are recorded in that same order.
+
         Parameters:
             destination_folder (str): The destination folder path.
             move_all_files (bool): Flag indicating whether to move all files or only media files.
+            max_workers (int): Number of files to move at the same time.
         """
         try:
             self.create_media_folder(destination_folder)
-            files_to_move = [stat for stat in self.file_stats if move_all_files or self.is_media_file(stat['File Name'])]
-            if not files_to_move:
+            # Rows are picked by index from the columns, so no file_stats row is built or formatted for the move
+            if move_all_files:
+                rows_to_move = range(len(self.names))
+            else:
+                # The types column holds the same lowercased extension is_media_file would compute
+                media_ext_set = self._media_ext_set
+                media_ext_suffixes = self._media_ext_suffixes
+                if media_ext_suffixes:
+                    # The types column keeps only the last suffix, so multi-dot extensions are checked on the names
+                    rows_to_move = [index for index, (file_type, name) in enumerate(zip(self.types, self.names))
+                                    if file_type in media_ext_set or name.lower().endswith(media_ext_suffixes)]
+                else:
+                    rows_to_move = [index for index, file_type in enumerate(self.types) if file_type in media_ext_set]
+            if not rows_to_move:
                 print("\nNO FILEs TO MOVE. ^<>^")
                 return -1
 
-            for file_stat in files_to_move:
-                source_path = os.path.join(file_stat['Source Folder'], file_stat['File Name'])
-                destination_path = os.path.join(destination_folder, file_stat['File Name'])
-
-                if source_path == destination_path:
-                    continue
-
-                # print("The Suffix remover: ",self.remove_number_suffix(os.path.splitext(destination_path)[0]))
-
-                # Handle duplicate filenames
-                if os.path.exists(destination_path):
-                    destination_path = self.rename_if_exists(destination_path)
-
-                shutil.move(source_path, destination_path)
-
-                # storing source path and destination path of the moved files in a dict {source_path: destination}
-                self.moved_files[source_path] = destination_path
-
-                print(f"\tMoved: {file_stat['File Name']}")
-
-            print(f"Total Files Moved: {len(files_to_move)}")
+            # On the same device a move is a plain rename, which never needs shutil.move's copy fallback.
+            # The device is checked once per source folder, so a mounted sub-folder goes straight to shutil.move.
+            destination_device = os.stat(destination_folder).st_dev
+            same_device_by_folder = {}
+            # A file already in the destination folder stays put, however its folder is spelled
+            destination_key = os.path.normcase(os.path.abspath(destination_folder))
+            in_destination_by_folder = {}
+            # Names taken in the destination, read once and extended with every name handed to a move
+            with os.scandir(destination_folder) as entries:
+                self._dest_names = {entry.name.casefold() for entry in entries}
+            # Join each folder with the separator once; the paths are then plain concatenations, same as os.path.join
+            folder_prefixes = {folder: os.path.join(folder, '') for folder in self.get_folders_info()}
+            destination_prefix = os.path.join(destination_folder, '')
+            names, folders, sizes = self.names, self.folders, self.sizes
+            source_paths = [folder_prefixes[folders[index]] + names[index] for index in rows_to_move]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # (future, source path, destination path, row index) of every submitted move, in submission order
+                moves = []
+                try:
+                    for index, source_path in zip(rows_to_move, source_paths):
+                        folder = folders[index]
+                        in_destination = in_destination_by_folder.get(folder)
+                        if in_destination is None:
+                            in_destination = in_destination_by_folder[folder] = os.path.normcase(os.path.abspath(folder)) == destination_key
+                        if in_destination:
+                            continue
+
+                        # Handle duplicate filenames
+                        destination_path = self.rename_if_exists(destination_prefix + names[index], self._dest_names)
+
+                        same_device = same_device_by_folder.get(folder)
+                        if same_device is None:
+                            try:
+                                same_device = os.stat(folder).st_dev == destination_device
+                            except OSError:
+                                # The folder is gone or unreadable since the scan: leave it to shutil.move, whose
+                                # error is then reported for each of its files like any other failed move
+                                same_device = False
+                            same_device_by_folder[folder] = same_device
+
+                        moves.append((executor.submit(self._move_file, source_path, destination_path, same_device), source_path, destination_path, index))
+                finally:
+                    # Recorded in submission order, which is scan order, and also when submitting stopped part way,
+                    # so every move that already happened is recorded. Only this thread prints, so the move threads
+                    # never wait on stdout
+                    moved_count = 0
+                    for move, source_path, destination_path, index in moves:
+                        try:
+                            move.result()
+                        except Exception as e:
+                            print(f"Error moving '{source_path}' to destination folder: {e}")
+                            continue
+
+                        # storing source path and destination path of the moved files in a dict {source_path: destination}
+                        self.moved_files[source_path] = destination_path
+                        # The size is already known from the scan, so the moved file is never stat-ed again
+                        self._moved_total_bytes += sizes[index]
+
+                        moved_count += 1
+                        if self.verbose:
+                            print(f"\tMoved: {names[index]}")
+                        elif self.progress_every and moved_count % self.progress_every == 0:
+                            print(f"\tMoved {moved_count}/{len(moves)} files")
+
+                    print(f"Total Files Moved: {moved_count}")
         except Exception as e:
             print(f"Error moving files to destination folder: {e}")
     
-    def rename_if_exists(self, filename):
+    @staticmethod
+    def _move_file(source_path, destination_path, same_device):
+        """
+        Move a single file, renaming it in place when source and destination share a device.
+
+        A same-device move skips shutil.move and its extra stat calls entirely; any other move is left to
+        shutil.move, which copies the file and then removes the source.
+
+        Parameters:
+            source_path (str): The path of the file to move.
+            destination_path (str): The path to move the file to; it must not exist yet.
+            same_device (bool): Whether the source folder and the destination folder are on the same device.
+        """
+        if same_device:
+            try:
+                os.replace(source_path, destination_path)
+                return
+            except OSError as e:
+                # A sub-folder can still be a mount point of another device
+                if e.errno != errno.EXDEV:
+                    raise
+        shutil.move(source_path, destination_path)
+
+    def rename_if_exists(self, filename, existing_names=None):
         """
         Rename a filename if it already exists in the destination folder.
 
         Parameters:
             filename (str): The filename to check and rename if necessary.
+            existing_names (set, optional): Casefolded names already taken in the destination folder. When given,
+                it is checked instead of the file system and the returned name is added to it.
 
         Returns:
             str: The new filename after renaming.
         """
-        
+        if existing_names is None:
+            is_taken = os.path.exists
+        else:
+            # Casefolded, so names differing only in case also conflict on case-insensitive file systems
+            is_taken = lambda path: os.path.basename(path).casefold() in existing_names
+
         base_name, extension = os.path.splitext(filename)
         base_name = self.remove_number_suffix(base_name)  # Remove (number) suffix if exists
         counter = 1
         new_filename = filename
         
-        while os.path.exists(new_filename):
+        while is_taken(new_filename):
             new_filename = f"{base_name}({counter}){extension}"
             counter += 1
 
+        if existing_names is not None:
+            existing_names.add(os.path.basename(new_filename).casefold())
         return new_filename
 
     @staticmethod
@@ -137,18 +247,19 @@ class MediaGatherer(FileStatsCollector):
         Returns:
             str: The basename without the "(number)" suffix.
         """
-        match = re.match(r'^(.*?)\(\d+\)$', basename)
+        match = MediaGatherer._SUFFIX_RE.match(basename)
         if match:
             return match.group(1)
         return basename
 
-    def gather_media(self, destination_folder=None, move_all=False):
+    def gather_media(self, destination_folder=None, move_all=False, max_workers=5):
         """
         Perform the media gathering process with options for destination folder and moving all files.
 
         Parameters:
             destination_folder (str): The destination folder path (default is 'media' subfolder).
             move_all (bool): Flag indicating whether to move all files or only media files.
+            max_workers (int): Number of files to move at the same time.
         """
         try:
             if destination_folder is None:
@@ -157,7 +268,7 @@ class MediaGatherer(FileStatsCollector):
 
             if self.all_files:
                 move_all = True
-            self.move_files_to_destination(destination_folder, move_all)
+            self.move_files_to_destination(destination_folder, move_all, max_workers)
             self.show_moved_stats()
         except Exception as e:
             print(f"Error gathering media: {e}")
@@ -168,7 +279,7 @@ class MediaGatherer(FileStatsCollector):
         """
         try:
             total_files = len(self.moved_files)
-            total_size = sum(os.path.getsize(file) for file in self.moved_files.values())
+            total_size = self._moved_total_bytes
 
             print("\n", " "*20, "Total Stats")
             print("=" * 60)
@@ -179,7 +290,10 @@ class MediaGatherer(FileStatsCollector):
     
     def generate_moved_stats_csv(self, csv_path=None):
         """
-        Under Construction
+        Generate a CSV file containing detailed statistics of the moved files, including where each one was moved to.
+
+        Parameters:
+            csv_path (str, optional): Path to save the CSV file. If not provided, it is saved in the root folder.
         """
         try:
             if not self.moved_files:
@@ -189,27 +303,38 @@ class MediaGatherer(FileStatsCollector):
             current_date = datetime.now().strftime('%Y%m%d_%H%M%S')
             csv_file_path = os.path.join(self.root_folder, f'{self.root_folder}_moved_files_stats_{current_date}.csv') if csv_path is None else csv_path
 
-            with open(csv_file_path, 'w', newline='', encoding="utf-8") as csvfile:
+            # Locate the moved files in the columns, keyed the same way move_files_to_destination keys moved_files.
+            # Only those rows are formatted, instead of building file_stats for every scanned file.
+            moved_files = self.moved_files
+            folder_prefixes = {folder: os.path.join(folder, '') for folder in self.get_folders_info()}
+            index_by_src = {}
+            for index, (folder, name) in enumerate(zip(self.folders, self.names)):
+                source_path = folder_prefixes[folder] + name
+                if source_path in moved_files:
+                    index_by_src[source_path] = index
+
+            names, types, sizes, ctimes, mtimes, folders = self.names, self.types, self.sizes, self.ctimes, self.mtimes, self.folders
+            format_size = self.format_size
+            format_timestamp = self.format_timestamp
+
+            def rows():
+                for source_path, destination_path in moved_files.items():
+                    index = index_by_src.get(source_path)
+                    # A path the scan never saw has no statistics to report
+                    if index is None:
+                        continue
+                    size = sizes[index]
+                    # Positional row in fieldnames order
+                    yield (names[index], types[index], size, format_size(size), format_timestamp(ctimes[index]),
+                           format_timestamp(mtimes[index]), folders[index], destination_path)
+
+            with open(csv_file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 fieldnames = ['File Name', 'File Type', 'File Size (Bytes)', 'File Size (Human Readable)',
                               'Creation Date', 'Modification Date', 'Source Folder', "Destination Folder"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-
-                for file in self.file_stats:
-                    # print(file)
-                    writer.writerow({
-                        'File Name': file["File Name"],
-                        'File Type': file["File Type"],
-                        'File Size (Bytes)': file["File Size (Bytes)"],
-                        'File Size (Human Readable)': file["File Size (Human Readable)"],
-                        'Creation Date': file["Creation Date"],
-                        'Modification Date': file["Modification Date"],
-                        'Source Folder': file["Source Folder"],
-                        'Destination Folder': self.moved_files[file["Source Folder"] + "\\" + file["File Name"]]
-                    }
-                        
-                    )
+                writer = csv.writer(csvfile)
+
+                writer.writerow(fieldnames)
+                writer.writerows(rows())
 
             print(f"\nStats CSV For Moved file generated: {csv_file_path}")
         except Exception as e:
@@ -220,13 +345,13 @@ class Gatherer(MediaGatherer):
     A class for gathering files of any specified extensions from a specified root folder.
 
     Attributes:
-        extensions (list): List of custom file extensions to gather.
+        extensions (tuple): Custom file extensions to gather.
         destination_folder (str): Folder where the files should be stored after being gathered
              Default: 'Extracted Files' folder under root
 
     Methods:
         set_extensions(extensions): To Set custom file extensions to gather.
-        gather_files(destination_folder=None, move_all=False): Perform the media gathering process with custom extensions.
+        gather_files(destination_folder=None, move_all=False, max_workers=5): Perform the media gathering process with custom extensions.
 
     Example Usage:
         root_directory = input("Enter the root directory: ")
@@ -237,7 +362,7 @@ class Gatherer(MediaGatherer):
         custom_gatherer.gather_files()
     """
 
-    def __init__(self, root_folder, destination_folder=None, extensions=None, skip_folders=None, all_files=False):
+    def __init__(self, root_folder, destination_folder=None, extensions=None, skip_folders=None, all_files=False, verbose=False, progress_every=50):
         if extensions is None:
             extensions = []
         if skip_folders is None:
@@ -246,33 +371,43 @@ class Gatherer(MediaGatherer):
             destination_folder = os.path.join(root_folder,"Extracted Files")
         self.destination_folder =  destination_folder
 
-        self.extensions = self.set_extensions(extensions)
+        # Gathering all files needs no extensions, every other run needs at least one
+        self.extensions = self.set_extensions(extensions) if extensions or not all_files else ()
         # self.skip_folders = skip_folders.append(destination_folder)
         # self.destination_folder = destination_folder
-        super().__init__(root_folder, destination_folder=self.destination_folder, media_extensions=self.extensions, skip_folders=skip_folders, all_files=all_files)
-        self.extensions = []
+        super().__init__(root_folder, destination_folder=self.destination_folder, media_extensions=self.extensions, skip_folders=skip_folders, all_files=all_files, verbose=verbose, progress_every=progress_every)
 
     def set_extensions(self, extensions):
         """
         Set custom file extensions to gather.
 
+        Blank entries, e.g. from splitting "mp3,,png" on commas, are dropped and the rest are stripped and lowercased.
+
         Parameters:
             extensions (list): List of custom file extensions.
+
+        Returns:
+            tuple: The cleaned extensions.
+
+        Raises:
+            ValueError: If no extension is left after cleaning.
         """
-        while any(element == "" for element in extensions):
-            extensions = input("Enter custom file extensions (comma-separated): ").split(',')
-        return extensions
+        cleaned = tuple(extension.strip().lower() for extension in extensions if extension.strip())
+        if not cleaned:
+            raise ValueError("No file extensions provided")
+        return cleaned
 
 
-    def gather_files(self, destination_folder=None, all_files=False):
+    def gather_files(self, destination_folder=None, all_files=False, max_workers=5):
         """
         Perform the media gathering process with custom extensions.
 
         Parameters:
             destination_folder (str): The destination folder path (default is 'Extracted Files' subfolder).
             move_all (bool): Flag indicating whether to move all files or only particular extension files.
+            max_workers (int): Number of files to move at the same time.
         """
         try:
-            super().gather_media(destination_folder, all_files)
+            super().gather_media(destination_folder, all_files, max_workers)
         except Exception as e:
             print(f"Error gathering media with custom extensions: {e}")